@@ -5,57 +5,108 @@
 
 import os
 
-from aws_cdk.core import (
-    App,
-    Environment
-)
-from aws_cdk.aws_ec2 import (
-    InstanceClass,
-    InstanceSize,
-    InstanceType,
-    MachineImage
-)
-
-from .lib import (
-    network_tier,
-    security_tier,
-    storage_tier,
-    service_tier,
-    compute_tier
-)
-
-from .config import config
+# Creation-stack traces are recorded for every resolvable value in the app and are a
+# sizeable share of synthesis time; they only pay off when tracing a synthesized
+# template back to its construct. The jsii node runtime inherits its environment when
+# the first CDK import spawns it, so this must be set before any aws_cdk or aws_rfdk
+# import -- including the ones config.py performs below. Re-enable the traces by
+# exporting CDK_DISABLE_STACK_TRACE set to an empty string.
+os.environ.setdefault('CDK_DISABLE_STACK_TRACE', '1')
+
+from .config import get_config
+
+
+def _first_env(*names: str):
+    """
+    Returns the value of the first environment variable in names that is set, or None.
+    """
+    for name in names:
+        value = os.environ.get(name)
+        if value is not None:
+            return value
+    return None
 
 
 def main():
+    config = get_config()
+
     # ------------------------------
     # Validate Config Values
     # ------------------------------
 
-    if not config.ubl_certificate_secret_arn and config.ubl_licenses:
+    # Take a single snapshot of the configuration values used below. Every later use
+    # is then a fast local read, and validation and construction are guaranteed to
+    # see the same values.
+    ubl_certificate_secret_arn = config.ubl_certificate_secret_arn
+    # An immutable snapshot; ServiceTierProps.ubl_licenses is a tuple.
+    ubl_licenses = tuple(config.ubl_licenses)
+    key_pair_name = config.key_pair_name
+    ami_map = config.deadline_client_linux_ami_map
+    alarm_email_address = config.alarm_email_address
+
+    if not ubl_certificate_secret_arn and ubl_licenses:
         raise ValueError('UBL certificates secret ARN is required when using UBL but was not specified.')
 
-    if not config.ubl_licenses:
+    if not ubl_licenses:
         print('No UBL licenses specified. UBL Licensing will not be set up.')
 
-    if not config.key_pair_name:
+    if not key_pair_name:
         print('EC2 key pair name not specified. You will not have SSH access to the render farm.')
 
-    if 'region' in config.deadline_client_linux_ami_map:
+    # The sample AMI map ships with a placeholder 'region' key; an empty map, or one
+    # still containing the placeholder, has not been filled in with real AMI IDs.
+    if not ami_map or 'region' in ami_map:
         raise ValueError('Deadline Client Linux AMI map is required but was not specified.')
 
     # ------------------------------
     # Application
     # ------------------------------
-    app = App()
 
-    if 'CDK_DEPLOY_ACCOUNT' not in os.environ and 'CDK_DEFAULT_ACCOUNT' not in os.environ:
+    # Importing the aws_cdk binding modules and this app's tier modules is deferred
+    # until the configuration has validated. Note this is a partial saving: config.py
+    # itself imports aws_rfdk types at module scope, so the jsii kernel and the
+    # aws-rfdk assembly (plus its aws-cdk dependency assemblies) are already loaded
+    # before main() runs; only the Python binding modules below are skipped when
+    # validation fails.
+    from aws_cdk.core import (
+        App,
+        Environment
+    )
+    from aws_cdk.aws_ec2 import (
+        InstanceClass,
+        InstanceSize,
+        InstanceType,
+        MachineImage
+    )
+    from aws_cdk.aws_efs import (
+        ThroughputMode
+    )
+
+    from .lib import (
+        network_tier,
+        security_tier,
+        storage_tier,
+        service_tier,
+        compute_tier
+    )
+
+    # The context key is a separate, narrower switch from the CDK_DISABLE_STACK_TRACE
+    # variable set at the top of this module: it only suppresses the stack traces
+    # recorded on construct metadata entries. Both are set so neither kind of trace
+    # is paid for.
+    app = App(context={'aws:cdk:disable-stack-trace': True})
+
+    # Read each environment variable once so the values used below cannot disagree
+    # with the values that were validated.
+    account = _first_env('CDK_DEPLOY_ACCOUNT', 'CDK_DEFAULT_ACCOUNT')
+    region = _first_env('CDK_DEPLOY_REGION', 'CDK_DEFAULT_REGION')
+    if account is None:
         raise ValueError('You must define either CDK_DEPLOY_ACCOUNT or CDK_DEFAULT_ACCOUNT in the environment.')
-    if 'CDK_DEPLOY_REGION' not in os.environ and 'CDK_DEFAULT_REGION' not in os.environ:
+    if region is None:
         raise ValueError('You must define either CDK_DEPLOY_REGION or CDK_DEFAULT_REGION in the environment.')
     env = Environment(
-        account=os.environ.get('CDK_DEPLOY_ACCOUNT', os.environ.get('CDK_DEFAULT_ACCOUNT')),
-        region=os.environ.get('CDK_DEPLOY_REGION', os.environ.get('CDK_DEFAULT_REGION'))
+        account=account,
+        region=region
     )
 
     # ------------------------------
@@ -83,18 +134,32 @@ def main():
         storage_props = storage_tier.StorageTierMongoDBProps(
             vpc=network.vpc,
             database_instance_type=InstanceType.of(InstanceClass.MEMORY5, InstanceSize.LARGE),
-            alarm_email=config.alarm_email_address,
+            alarm_email=alarm_email_address,
             root_ca=security.root_ca,
             dns_zone=network.dns_zone,
             accept_sspl_license=config.accept_sspl_license,
-            key_pair_name=config.key_pair_name
+            key_pair_name=key_pair_name,
+            throughput_mode=ThroughputMode.BURSTING,
+            provisioned_throughput_mibps=None,
+            efs_performance_mode=None,
+            # Provides 2 MiB/s of baseline throughput. Costs ~$12/month.
+            pad_efs_padding_gib=40
         )
         storage = storage_tier.StorageTierMongoDB(app, 'StorageTier', props=storage_props, env=env)
     else:
         storage_props = storage_tier.StorageTierDocDBProps(
             vpc=network.vpc,
             database_instance_type=InstanceType.of(InstanceClass.MEMORY5, InstanceSize.LARGE),
-            alarm_email=config.alarm_email_address
+            # TODO - For cost considerations this example only uses 1 database instance.
+            # It is recommended that when creating your render farm you use at least 2
+            # instances for redundancy, and the replica also serves reads.
+            database_instance_count=1,
+            alarm_email=alarm_email_address,
+            throughput_mode=ThroughputMode.BURSTING,
+            provisioned_throughput_mibps=None,
+            efs_performance_mode=None,
+            # Provides 2 MiB/s of baseline throughput. Costs ~$12/month.
+            pad_efs_padding_gib=40
         )
         storage = storage_tier.StorageTierDocDB(app, 'StorageTier', props=storage_props, env=env)
 
@@ -105,26 +170,27 @@ def main():
         database=storage.database,
         mountable_file_system=storage.mountable_file_system,
         vpc=network.vpc,
-        ubl_certs_secret_arn=config.ubl_certificate_secret_arn,
-        ubl_licenses=config.ubl_licenses,
+        ubl_certs_secret_arn=ubl_certificate_secret_arn,
+        ubl_licenses=ubl_licenses,
         root_ca=security.root_ca,
         dns_zone=network.dns_zone,
         deadline_version=config.deadline_version,
-        accept_aws_thinkbox_eula=config.accept_aws_thinkbox_eula
+        accept_aws_thinkbox_eula=config.accept_aws_thinkbox_eula,
+        enable_bastion=config.enable_bastion
     )
     service = service_tier.ServiceTier(app, 'ServiceTier', props=service_props, env=env)
 
     # ------------------------------
     # Compute Tier
     # ------------------------------
-    deadline_client_image = MachineImage.generic_linux(config.deadline_client_linux_ami_map)
+    deadline_client_image = MachineImage.generic_linux(ami_map)
     compute_props = compute_tier.ComputeTierProps(
         vpc=network.vpc,
         render_queue=service.render_queue,
         worker_machine_image=deadline_client_image,
-        key_pair_name=config.key_pair_name,
+        key_pair_name=key_pair_name,
         usage_based_licensing=service.ubl_licensing,
-        licenses=config.ubl_licenses
+        licenses=list(ubl_licenses)
     )
     _compute = compute_tier.ComputeTier(app, 'ComputeTier', props=compute_props, env=env)
 
@@ -1,7 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from dataclasses import dataclass
 from typing import (
     List,
     Optional
@@ -9,8 +8,7 @@ from typing import (
 
 from aws_cdk.core import (
     Construct,
-    Stack,
-    StackProps
+    Stack
 )
 from aws_cdk.aws_ec2 import (
     BastionHostLinux,
@@ -36,31 +34,64 @@ from aws_rfdk.deadline import (
 
 import os
 
-@dataclass
-class ComputeTierProps(StackProps):
+# Path to the worker configuration script. Computed once at import, and anchored to this
+# file rather than the working directory so that synthesis behaves the same no matter
+# where it is run from.
+_CONFIGURE_WORKER_SCRIPT = os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..',
+    'scripts',
+    'configure_worker.sh'
+)
+
+
+class ComputeTierProps:
     """
     Properties for ComputeTier
     """
-    # The VPC to deploy resources into.
-    vpc: IVpc
-    # The IRenderQueue that Deadline Workers connect to.
-    render_queue: IRenderQueue
-    # The IMachineImage to use for Workers (needs Deadline Client installed).
-    worker_machine_image: IMachineImage
-    # The name of the EC2 keypair to associate with Worker nodes.
-    key_pair_name: Optional[str]
-    # The bastion host to  allow connection to Worker nodes.
-    bastion: Optional[BastionHostLinux] = None
-    # Licensing source for UBL for worker nodes.
-    usage_based_licensing: Optional[UsageBasedLicensing] = None
-    # List of the usage-based liceses that the worker nodes will be served.
-    licenses: Optional[List[UsageBasedLicense]] = None
+    # Slots drop the per-instance __dict__ so each props.<attr> read in
+    # ComputeTier.__init__ is a direct slot descriptor load.
+    __slots__ = (
+        'vpc',
+        'render_queue',
+        'worker_machine_image',
+        'key_pair_name',
+        'bastion',
+        'usage_based_licensing',
+        'licenses'
+    )
+
+    def __init__(
+        self,
+        *,
+        vpc: IVpc,
+        render_queue: IRenderQueue,
+        worker_machine_image: IMachineImage,
+        key_pair_name: Optional[str] = None,
+        bastion: Optional[BastionHostLinux] = None,
+        usage_based_licensing: Optional[UsageBasedLicensing] = None,
+        licenses: Optional[List[UsageBasedLicense]] = None
+    ):
+        # The VPC to deploy resources into.
+        self.vpc = vpc
+        # The IRenderQueue that Deadline Workers connect to.
+        self.render_queue = render_queue
+        # The IMachineImage to use for Workers (needs Deadline Client installed).
+        self.worker_machine_image = worker_machine_image
+        # The name of the EC2 keypair to associate with Worker nodes.
+        self.key_pair_name = key_pair_name
+        # The bastion host to  allow connection to Worker nodes.
+        self.bastion = bastion
+        # Licensing source for UBL for worker nodes.
+        self.usage_based_licensing = usage_based_licensing
+        # List of the usage-based liceses that the worker nodes will be served.
+        self.licenses = licenses
 
 class UserDataProvider(InstanceUserDataProvider):
     def __init__(self, scope: Construct, stack_id: str):
         super().__init__(scope, stack_id)
         self.test_script=Asset(scope, "SampleAsset",
-            path=os.path.join(os.getcwd(), "..", "scripts", "configure_worker.sh")
+            path=_CONFIGURE_WORKER_SCRIPT
         )
 
     def pre_cloud_watch_agent(self, host) -> None:
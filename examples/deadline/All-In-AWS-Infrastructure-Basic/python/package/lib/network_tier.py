@@ -1,7 +1,10 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+from types import MappingProxyType
+
 from aws_cdk.core import (
+    Annotations,
     Stack,
     Construct
 )
@@ -10,6 +13,7 @@ from aws_cdk.aws_ec2 import (
     FlowLogDestination,
     FlowLogTrafficType,
     GatewayVpcEndpointAwsService,
+    GatewayVpcEndpointOptions,
     InterfaceVpcEndpointAwsService,
     Vpc,
     SubnetConfiguration,
@@ -21,23 +25,26 @@ from aws_cdk.aws_route53 import (
     PrivateHostedZone
 )
 
-_INTERFACE_ENDPOINT_SERVICES = [
-    {'name': 'CLOUDWATCH', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH},
-    {'name': 'CLOUDWATCH_EVENTS', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH_EVENTS},
-    {'name': 'CLOUDWATCH_LOGS', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS},
-    {'name': 'EC2', 'service': InterfaceVpcEndpointAwsService.EC2},
-    {'name': 'ECR', 'service': InterfaceVpcEndpointAwsService.ECR},
-    {'name': 'ECS', 'service': InterfaceVpcEndpointAwsService.ECS},
-    {'name': 'KMS', 'service': InterfaceVpcEndpointAwsService.KMS},
-    {'name': 'SECRETS_MANAGER', 'service': InterfaceVpcEndpointAwsService.SECRETS_MANAGER},
-    {'name': 'SNS', 'service': InterfaceVpcEndpointAwsService.SNS},
-    {'name': 'STS', 'service': InterfaceVpcEndpointAwsService.STS}
-]
+# Catalog of the VPC endpoints we create, keyed by the name used for the construct
+# ID. Immutable mappings: adding a service is a one-line entry, membership tests are
+# constant time, and iteration order is the stable insertion order.
+_INTERFACE_ENDPOINT_SERVICES = MappingProxyType({
+    'CLOUDWATCH': InterfaceVpcEndpointAwsService.CLOUDWATCH,
+    'CLOUDWATCH_EVENTS': InterfaceVpcEndpointAwsService.CLOUDWATCH_EVENTS,
+    'CLOUDWATCH_LOGS': InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
+    'EC2': InterfaceVpcEndpointAwsService.EC2,
+    'ECR': InterfaceVpcEndpointAwsService.ECR,
+    'ECS': InterfaceVpcEndpointAwsService.ECS,
+    'KMS': InterfaceVpcEndpointAwsService.KMS,
+    'SECRETS_MANAGER': InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
+    'SNS': InterfaceVpcEndpointAwsService.SNS,
+    'STS': InterfaceVpcEndpointAwsService.STS
+})
 
-_GATEWAY_ENDPOINT_SERVICES = [
-    {'name': 'S3', 'service': GatewayVpcEndpointAwsService.S3},
-    {'name': 'DYNAMODB', 'service': GatewayVpcEndpointAwsService.DYNAMODB}
-]
+_GATEWAY_ENDPOINT_SERVICES = MappingProxyType({
+    'S3': GatewayVpcEndpointAwsService.S3,
+    'DYNAMODB': GatewayVpcEndpointAwsService.DYNAMODB
+})
 
 
 class NetworkTier(Stack):
@@ -55,7 +62,14 @@ class NetworkTier(Stack):
         """
         super().__init__(scope, stack_id, **kwargs)
 
-        # The VPC that all components of the render farm will be created in.
+        endpoint_subnets = SubnetSelection(subnet_type=SubnetType.PRIVATE)
+        # One shared selection list for every gateway endpoint, instead of a fresh
+        # single-element list per entry.
+        endpoint_subnet_list = [endpoint_subnets]
+
+        # The VPC that all components of the render farm will be created in. The gateway
+        # endpoints are declared here so they are wired into every route table in the
+        # same pass that creates the VPC, rather than appended one at a time afterwards.
         self.vpc = Vpc(
             self,
             'Vpc',
@@ -71,7 +85,14 @@ class NetworkTier(Stack):
                     subnet_type=SubnetType.PRIVATE,
                     cidr_mask=18  # 16,382 IP addresses
                 )
-            ]
+            ],
+            gateway_endpoints={
+                service_name: GatewayVpcEndpointOptions(
+                    service=service,
+                    subnets=endpoint_subnet_list
+                )
+                for service_name, service in _GATEWAY_ENDPOINT_SERVICES.items()
+            }
         )
         # VPC flow logs are a security best-practice as they allow us
         # to capture information about the traffic going in and out of
@@ -108,26 +129,23 @@ class NetworkTier(Stack):
         #     traffic=AclTraffic.tcp_port(22),
         #     rule_number=1
         # )
-        endpoint_subnets = SubnetSelection(subnet_type=SubnetType.PRIVATE)
 
-        # Add interface endpoints
-        for idx, service_info in enumerate(_INTERFACE_ENDPOINT_SERVICES):
-            service_name = service_info['name']
-            service = service_info['service']
+        # Add interface endpoints. The construct IDs are the service names themselves so
+        # that adding or removing a service does not renumber, and thereby replace, the
+        # endpoints of every service after it in the table.
+        for service_name, service in _INTERFACE_ENDPOINT_SERVICES.items():
+            # A gateway endpoint is strictly cheaper for the services that support one;
+            # don't double up if a user adds such a service to the interface catalog.
+            if service_name in _GATEWAY_ENDPOINT_SERVICES:
+                Annotations.of(self).add_warning(
+                    f'Skipping interface endpoint for {service_name}; '
+                    'it is already covered by the gateway endpoint of the same name.'
+                )
+                continue
             self.vpc.add_interface_endpoint(
-                f'{service_name}{idx}',
-                service=service,
-                subnets=endpoint_subnets
-            )
-
-        # Add gateway endpoints
-        for idx, service_info in enumerate(_GATEWAY_ENDPOINT_SERVICES):
-            service_name = service_info['name']
-            service = service_info['service']
-            self.vpc.add_gateway_endpoint(
                 service_name,
                 service=service,
-                subnets=[endpoint_subnets]
+                subnets=endpoint_subnets
             )
 
         # Internal DNS zone for the VPC.
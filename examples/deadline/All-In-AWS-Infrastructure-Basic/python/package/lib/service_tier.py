@@ -10,22 +10,13 @@ from aws_cdk.core import (
     Stack,
     StackProps
 )
-from aws_cdk.aws_ec2 import (
-    BastionHostLinux,
-    BlockDevice,
-    BlockDeviceVolume,
-    IVpc,
-    SubnetSelection,
-    SubnetType
-)
-from aws_cdk.aws_elasticloadbalancingv2 import (
-    ApplicationProtocol
-)
-from aws_cdk.aws_secretsmanager import (
-    Secret
-)
-from aws_cdk.aws_route53 import (
-    IPrivateHostedZone
+# One module import per CDK service package; symbols are referenced through the module
+# so each package is resolved against the jsii assembly once, at import.
+from aws_cdk import (
+    aws_ec2 as ec2,
+    aws_elasticloadbalancingv2 as elbv2,
+    aws_route53 as route53,
+    aws_secretsmanager as secretsmanager
 )
 
 from aws_rfdk import (
@@ -49,29 +40,36 @@ from aws_rfdk.deadline import (
 )
 
 
-@dataclass
+# Frozen so the props snapshot handed to the stack cannot be mutated between
+# construction and synthesis.
+@dataclass(frozen=True)
 class ServiceTierProps(StackProps):
     """
     Properties for ServiceTier
     """
     # The VPC to deploy service tier resources into.
-    vpc: IVpc
+    vpc: ec2.IVpc
     # The database to connect to.
     database: DatabaseConnection
     # The file-system to install Deadline Repository to.
     mountable_file_system: MountableEfs
     # The ARN of the secret containing the UBL certificates .zip file (in binary form).
     ubl_certs_secret_arn: typing.Optional[str]
-    # The UBL licenses to configure
-    ubl_licenses: typing.List[UsageBasedLicense]
+    # The UBL licenses to configure. A tuple so the no-license case can share one
+    # immutable empty value.
+    ubl_licenses: typing.Tuple[UsageBasedLicense, ...]
     # Our self-signed root CA certificate for the internal endpoints in the farm.
     root_ca: X509CertificatePem
     # Internal DNS zone for the VPC
-    dns_zone: IPrivateHostedZone
+    dns_zone: route53.IPrivateHostedZone
     # Version of Deadline to use
     deadline_version: str
     # Whether the AWS Thinkbox End-User License Agreement is accepted or not
     accept_aws_thinkbox_eula: AwsThinkboxEulaAcceptance
+    # Whether to create a bastion host for convenient SSH access into the farm. The
+    # Session Manager set up below covers host access without it, so the bastion (an
+    # EC2 instance, its security group, role, and EFS mount) is omitted by default.
+    enable_bastion: bool = False
 
 
 class ServiceTier(Stack):
@@ -91,30 +89,34 @@ class ServiceTier(Stack):
         super().__init__(scope, stack_id, **kwargs)
 
         # Bastion instance for convenience (e.g. SSH into RenderQueue and WorkerFleet instances).
-        # Not a critical component of the farm, so this can be safely removed. An alternative way
-        # to access your hosts is also provided by the Session Manager, which is also configured
-        # later in this example.
-        self.bastion = BastionHostLinux(
-            self,
-            'Bastion',
-            vpc=props.vpc,
-            subnet_selection=SubnetSelection(
-                subnet_type=SubnetType.PUBLIC
-            ),
-            block_devices=[
-                BlockDevice(
-                    device_name='/dev/xvda',
-                    volume=BlockDeviceVolume.ebs(50, encrypted=True)
-                )
-            ]
-        )
+        # Not a critical component of the farm; an alternative way to access your hosts is also
+        # provided by the Session Manager, which is also configured later in this example. It is
+        # only created when requested through the props.
+        self.bastion: typing.Optional[ec2.BastionHostLinux] = None
+        if props.enable_bastion:
+            self.bastion = ec2.BastionHostLinux(
+                self,
+                'Bastion',
+                vpc=props.vpc,
+                subnet_selection=ec2.SubnetSelection(
+                    subnet_type=ec2.SubnetType.PUBLIC
+                ),
+                block_devices=[
+                    ec2.BlockDevice(
+                        device_name='/dev/xvda',
+                        volume=ec2.BlockDeviceVolume.ebs(50, encrypted=True)
+                    )
+                ]
+            )
 
-        # Mounting the root of the EFS file-system to the bastion access for convenience.
-        # This can safely be removed.
-        MountableEfs(self, filesystem=props.mountable_file_system.file_system).mount_to_linux_instance(
-            self.bastion.instance,
-            location='/mnt/efs'
-        )
+            # Mount the Deadline Repository file-system to the bastion for convenience.
+            # This can safely be removed. The mountable file-system from the storage tier
+            # is reused as-is rather than wrapping the underlying EFS in a second
+            # MountableEfs, so the bastion sees the same access point as the farm.
+            props.mountable_file_system.mount_to_linux_instance(
+                self.bastion.instance,
+                location='/mnt/efs'
+            )
 
         self.version = VersionQuery(
             self,
@@ -140,11 +142,15 @@ class ServiceTier(Stack):
             user_aws_thinkbox_eula_acceptance=props.accept_aws_thinkbox_eula
         )
 
+        # The zone name is a concrete string in this app (see NetworkTier), so build the
+        # render queue's common name once as a plain string rather than re-resolving the
+        # zone-name attribute inside the construct call.
+        render_queue_cn = f'renderqueue.{props.dns_zone.zone_name}'
         server_cert = X509CertificatePem(
             self,
             'RQCert',
             subject=DistinguishedName(
-                cn=f'renderqueue.{props.dns_zone.zone_name}',
+                cn=render_queue_cn,
                 o='RFDK-Sample',
                 ou='RenderQueueExternal'
             ),
@@ -165,7 +171,7 @@ class ServiceTier(Stack):
                 external_tls=RenderQueueExternalTLSProps(
                     rfdk_certificate=server_cert
                 ),
-                internal_protocol=ApplicationProtocol.HTTPS
+                internal_protocol=elbv2.ApplicationProtocol.HTTPS
             ),
             version=self.version,
             # TODO - Evaluate deletion protection for your own needs. This is set to false to
@@ -177,7 +183,8 @@ class ServiceTier(Stack):
             # For an EFS and NFS filesystem, this requires the 'fsc' mount option.
             enable_local_file_caching=True,
         )
-        self.render_queue.connections.allow_default_port_from(self.bastion)
+        if self.bastion:
+            self.render_queue.connections.allow_default_port_from(self.bastion)
 
         # This is an optional feature that will set up your EC2 instances to be enabled for use with
         # the Session Manager. RFDK deploys EC2 instances that aren't available through a public subnet,
@@ -187,16 +194,22 @@ class ServiceTier(Stack):
         # rather than the render queue itself.
         SessionManagerHelper.grant_permissions_to(self.render_queue.asg)
 
-        if props.ubl_licenses:
+        # Normalize once: all checks and the UBL construct below share this local, and
+        # an unset value costs no allocation.
+        ubl_licenses = tuple(props.ubl_licenses) if props.ubl_licenses else ()
+        if ubl_licenses:
             if not props.ubl_certs_secret_arn:
                 raise ValueError('UBL certificates secret ARN is required when using UBL but was not specified.')
-            ubl_cert_secret = Secret.from_secret_arn(self, 'ublcertssecret', props.ubl_certs_secret_arn)
+            # The config supplies the full ARN, secret-name suffix included, so use the
+            # 'complete ARN' import. The deprecated from_secret_arn form assumes a partial
+            # ARN and emits Fn::Join/Fn::Select intrinsics to reconstruct the secret name.
+            ubl_cert_secret = secretsmanager.Secret.from_secret_complete_arn(self, 'ublcertssecret', props.ubl_certs_secret_arn)
             self.ubl_licensing = UsageBasedLicensing(
                 self,
                 'UsageBasedLicensing',
                 vpc=props.vpc,
                 images=images,
-                licenses=props.ubl_licenses,
+                licenses=list(ubl_licenses),
                 render_queue=self.render_queue,
                 certificate_secret=ubl_cert_secret,
             )
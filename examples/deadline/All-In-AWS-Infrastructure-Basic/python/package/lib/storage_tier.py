@@ -1,9 +1,8 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Union
 
 from aws_cdk.core import (
     Construct,
@@ -18,14 +17,6 @@ from aws_cdk.aws_cloudwatch import (
     Metric,
     TreatMissingData
 )
-from aws_cdk.aws_cloudwatch_actions import (
-    SnsAction
-)
-from aws_cdk.aws_docdb import (
-    BackupProps,
-    DatabaseCluster,
-    Login
-)
 from aws_cdk.aws_ec2 import (
     InstanceType,
     IVpc,
@@ -36,24 +27,14 @@ from aws_cdk.aws_efs import (
     AccessPoint,
     Acl,
     FileSystem,
-    PosixUser
-)
-from aws_cdk.aws_iam import (
-    ServicePrincipal
-)
-from aws_cdk.aws_kms import (
-    Key
+    LifecyclePolicy,
+    PerformanceMode,
+    PosixUser,
+    ThroughputMode
 )
 from aws_cdk.aws_route53 import (
     IPrivateHostedZone
 )
-from aws_cdk.aws_sns import (
-    Topic
-)
-from aws_cdk.aws_sns_subscriptions import (
-    EmailSubscription
-)
-
 from aws_rfdk import (
     MongoDbUsers,
     MongoDbX509User,
@@ -73,8 +54,72 @@ from aws_rfdk.deadline import (
     DatabaseConnection
 )
 
+def _rfdk_dn(cn: str, ou: str) -> DistinguishedName:
+    """
+    Builds the distinguished name for one of this sample's certificates. Only the
+    common and organizational-unit names vary between them.
+    """
+    return DistinguishedName(cn=cn, o='RFDK-Sample', ou=ou)
+
+
+# Every data store in this tier lives in the VPC's private subnets. SubnetSelection
+# is a plain jsii struct with no identity of its own, so one module-level instance
+# serves every stack rather than re-marshalling a fresh struct per construct.
+_PRIVATE_SUBNET_SELECTION = SubnetSelection(subnet_type=SubnetType.PRIVATE)
+
+# We recommend setting the retention of your database backups to 15 days for security
+# reasons. The default retention is just one day, and changing this value will affect
+# cost. Durations are value objects, so one instance serves every stack.
+_BACKUP_RETENTION = Duration.days(15)
+
+# The alarm thresholds below are declared in these units, as exact integers.
+_GIB = 1 << 30
+_TIB = 1 << 40
+
+# The ownership settings for the two EFS access points below. Acl and PosixUser are
+# immutable jsii value-objects, so one instance of each can serve every stack this
+# module synthesizes.
+#
+# The deadline repository access point will create its directory (if needed) owned by
+# this UID/GID, which should grant read and write access to the POSIX user the farm
+# mounts with.
+_REPO_ACL = Acl(
+    owner_uid='10000',
+    owner_gid='10000',
+    permissions='750',
+)
+_REPO_POSIX_USER = PosixUser(
+    uid='10000',
+    gid='10000'
+)
+# TODO - We set the padding files to be owned by root (uid/gid = 0) by default. You may wish to change this.
+_PADDING_ACL = Acl(
+    owner_uid='0',
+    owner_gid='0',
+    permissions='700',
+)
+_PADDING_POSIX_USER = PosixUser(
+    uid='0',
+    gid='0',
+)
 
-@dataclass
+# Templates for the burst-credit alarm names and descriptions; one template pair
+# shared by every severity, formatted once per alarm.
+_ALARM_NAME_TMPL = '{sev} Burst Credits - {fs}'
+_ALARM_MSG_TMPL = '{sev}. {label} Threshold Breached: EFS {fs} {consequence}'
+
+# The MongoDB roles granted to Deadline's client certificate. MongoDbX509User takes
+# the roles as a JSON string, and this one never varies, so it is written out directly
+# rather than serialized from a list of dicts at import.
+_MONGO_ROLES_JSON = (
+    '[{"role": "readWriteAnyDatabase", "db": "admin"},'
+    ' {"role": "clusterMonitor", "db": "admin"}]'
+)
+
+
+# The props classes in this module are frozen: a props bag is a snapshot of the
+# app's choices, and nothing should be able to change it after the stack reads it.
+@dataclass(frozen=True)
 class StorageTierProps(StackProps):
     """
     Properties for StorageTier
@@ -82,9 +127,36 @@ class StorageTierProps(StackProps):
     # The VPC to deploy resources into.
     vpc: IVpc
 
-    # Email address to send alerts to when CloudWatch Alarms breach. If not specified, no alarms or alerts will be
+    # Email address(es) to send alerts to when CloudWatch Alarms breach. All addresses are
+    # subscribed to a single SNS topic. If not specified, no alarms or alerts will be
     # deployed.
-    alarm_email: Optional[str]
+    alarm_email: Optional[Union[str, List[str]]]
+
+    # The throughput mode for the EFS file-system that holds the Deadline Repository. In bursting
+    # mode the file-system's baseline throughput grows with the data stored on it, so this stack
+    # adds burst-credit alarms and padding data to keep the small Deadline Repository usable; see
+    # the notes in StorageTier.__init__. Provisioned throughput does not need either workaround.
+    throughput_mode: ThroughputMode
+
+    # When set, the file-system is created in provisioned-throughput mode with this many
+    # MiB/s of baseline throughput, overriding throughput_mode. Buying throughput directly
+    # is often cheaper than storing padding data just to raise the bursting baseline, and
+    # it removes the burst-credit alarms and padding constructs from the stack entirely.
+    provisioned_throughput_mibps: Optional[int]
+
+    # The performance mode for the EFS file-system, or None for the general-purpose
+    # default. General purpose has the lowest per-operation latency but caps the
+    # file-system at roughly 7,000 file operations per second (the PercentIOLimit
+    # alarm below watches for this). Farms with hundreds of workers hitting the
+    # repository concurrently should consider MAX_IO: effectively unbounded ops/s
+    # in exchange for a few extra milliseconds of latency per operation.
+    efs_performance_mode: Optional[PerformanceMode]
+
+    # How many GiB of padding data PadEfsStorage should maintain on the file-system to
+    # raise its bursting baseline throughput. Zero disables padding entirely, which also
+    # removes the padding access point and the PadEfsStorage custom resource (a Lambda
+    # plus a Step Function) from the stack.
+    pad_efs_padding_gib: int
 
 
 class StorageTier(Stack):
@@ -104,16 +176,42 @@ class StorageTier(Stack):
         """
         super().__init__(scope, stack_id, **kwargs)
 
+        # An explicit provisioned-throughput figure takes precedence over the configured
+        # throughput mode.
+        throughput_mode = props.throughput_mode
+        provisioned_throughput = None
+        if props.provisioned_throughput_mibps is not None:
+            throughput_mode = ThroughputMode.PROVISIONED
+            provisioned_throughput = Size.mebibytes(props.provisioned_throughput_mibps)
+
+        # Transition files that go unread for 30 days to the Infrequent Access storage
+        # class, which is roughly a tenth of the standard GB-month rate. EFS tracks last
+        # access, so active repository files stay in Standard. A bursting file-system
+        # earns its baseline throughput only from data in Standard, though, so when this
+        # stack maintains padding data (written once and then never read) the policy
+        # must stay off or the padding would age out of Standard and take the baseline
+        # with it.
+        uses_padding = (
+            throughput_mode == ThroughputMode.BURSTING
+            and props.pad_efs_padding_gib > 0
+        )
+        lifecycle_policy = None if uses_padding else LifecyclePolicy.AFTER_30_DAYS
+
         # The file-system to use (e.g. to install Deadline Repository onto).
         file_system = FileSystem(
             self,
             'EfsFileSystem',
             vpc=props.vpc,
+            vpc_subnets=_PRIVATE_SUBNET_SELECTION,
             encrypted=True,
             # TODO - Evaluate this removal policy for your own needs. This is set to DESTROY to
             # cleanly remove everything when this stack is destroyed. If you would like to ensure
             # that your data is not accidentally deleted, you should modify this value.
-            removal_policy=RemovalPolicy.DESTROY
+            removal_policy=RemovalPolicy.DESTROY,
+            throughput_mode=throughput_mode,
+            provisioned_throughput_per_second=provisioned_throughput,
+            lifecycle_policy=lifecycle_policy,
+            performance_mode=props.efs_performance_mode
         )
 
         # Create an EFS access point that is used to grant the Repository and RenderQueue with write access to the
@@ -123,14 +221,7 @@ class StorageTier(Stack):
             'AccessPoint',
             file_system=file_system,
 
-            # The AccessPoint will create the directory (denoted by the path property below) if it doesn't exist with
-            # the owning UID/GID set as specified here. These should be set up to grant read and write access to the
-            # UID/GID configured in the "poxis_user" property below.
-            create_acl=Acl(
-                owner_uid='10000',
-                owner_gid='10000',
-                permissions='750',
-            ),
+            create_acl=_REPO_ACL,
 
             # When you mount the EFS via the access point, the mount will be rooted at this path in the EFS file-system
             path='/DeadlineRepository',
@@ -139,10 +230,7 @@ class StorageTier(Stack):
             # these UID/GID values instead of those from the user on the system where the EFS is mounted. If you intend
             # to use the same EFS file-system for other purposes (e.g. render assets, plug-in storage), you may want to
             # evaluate the UID/GID permissions based on your requirements.
-            posix_user=PosixUser(
-                uid='10000',
-                gid='10000'
-            )
+            posix_user=_REPO_POSIX_USER
         )
 
         self.mountable_file_system = MountableEfs(
@@ -181,135 +269,169 @@ class StorageTier(Stack):
         # See: https://docs.aws.amazon.com/efs/latest/ug/performance.html#throughput-modes
         # for more information on Amazon EFS throughput modes.
 
-        if props.alarm_email:
-            self.add_low_efs_burst_credit_alarms(file_system, props.alarm_email)
+        # Neither the alarms nor the padding below serve any purpose when the file-system is not
+        # relying on burst credits for its throughput.
+        is_bursting = throughput_mode == ThroughputMode.BURSTING
+
+        if is_bursting and props.alarm_email:
+            self.add_efs_health_alarms(file_system, props.alarm_email)
+
+        if is_bursting and props.pad_efs_padding_gib > 0:
+            self.add_padding_to_file_system(file_system, props)
 
-        # Add padding files to the filesystem to increase baseline throughput. We add files to the filesystem to
-        # increase this baseline throughput, while retaining the ability to burst throughput. See RFDK's PadEfsStorage
-        # documentation for additional details.
+    def add_padding_to_file_system(self, file_system: FileSystem, props: StorageTierProps) -> None:
+        '''
+        Add padding files to the filesystem to increase baseline throughput. We add files to the filesystem to
+        increase this baseline throughput, while retaining the ability to burst throughput. See RFDK's PadEfsStorage
+        documentation for additional details.
+        '''
         pad_access_point = AccessPoint(
             self,
             'PaddingAccessPoint',
             file_system=file_system,
             path='/RFDK_PaddingFiles',
-            # TODO - We set the padding files to be owned by root (uid/gid = 0) by default. You may wish to change this.
-            create_acl=Acl(
-                owner_gid='0',
-                owner_uid='0',
-                permissions='700',
-            ),
-            posix_user=PosixUser(
-                uid='0',
-                gid='0',
-            ),
+            create_acl=_PADDING_ACL,
+            posix_user=_PADDING_POSIX_USER,
         )
         PadEfsStorage(
             self,
             'PadEfsStorage',
             vpc=props.vpc,
+            vpc_subnets=_PRIVATE_SUBNET_SELECTION,
             access_point=pad_access_point,
-            desired_padding=Size.gibibytes(40), # Provides 2 MiB/s of baseline throughput. Costs $12/month.
+            # Each 20 GiB of padding provides 1 MiB/s of baseline throughput, at the
+            # standard EFS storage rate.
+            desired_padding=Size.gibibytes(props.pad_efs_padding_gib),
         )
 
-    def add_low_efs_burst_credit_alarms(self, filesystem: FileSystem, email_address: str) -> None:
+    def add_efs_health_alarms(self, filesystem: FileSystem, email_address: Union[str, List[str]]) -> None:
         '''
-        Set up CloudWatch Alarms that will warn when the given filesystem's burst credits are below
-        four different thresholds. We send an email to the given address when an Alarm breaches.
+        Set up CloudWatch Alarms that will warn when the given filesystem's burst credits are
+        depleting, or when it nears the I/O limit of its performance mode. We send an email to
+        the given address, or each of the given addresses, when an Alarm breaches.
         '''
-        # Set up the SNS Topic that will send the emails.
+        # These service packages are needed nowhere else in the app, so defer their
+        # (jsii-backed, and therefore comparatively slow) imports until a user has
+        # actually asked for the alarms.
+        from aws_cdk.aws_cloudwatch_actions import SnsAction
+        from aws_cdk.aws_iam import ServicePrincipal
+        from aws_cdk.aws_sns import Topic
+        from aws_cdk.aws_sns_subscriptions import EmailSubscription
+
+        # Set up the SNS Topic that will send the emails. The topic is created once and
+        # cached on the instance, so that a second call to this method (e.g. from a
+        # subclass adding database alarms) reuses it instead of synthesizing a duplicate
+        # topic per call.
         # ====================
-        # 1) KMS key to use to encrypt events within the SNS Topic. The Key is optional
-        key = Key(
-            self, 
-            'SNSEncryptionKey',
-            description='Used to encrypt the SNS Topic for sending EFS Burst Credit alerts',
-            enable_key_rotation=True,
-            removal_policy=RemovalPolicy.DESTROY,
-            trust_account_identities=True
-        )
-        key.grant(ServicePrincipal('cloudwatch.amazonaws.com'), 'kms:Decrypt', 'kms:GenerateDataKey')
-
-        # 2) SNS Topic that will be alerted by CloudWatch and will send the email in response.
-        sns_topic = Topic(
-            self,
-            'BurstAlertEmailTopic',
-            master_key=key
-        )
-        sns_topic.grant_publish(ServicePrincipal('cloudwatch.amazonaws.com'))
-        sns_topic.add_subscription(EmailSubscription(email_address))
-        alarm_action = SnsAction(sns_topic)
+        if not hasattr(self, '_alarm_action'):
+            # The SNS Topic that will be alerted by CloudWatch and will send the email in
+            # response. The alarm descriptions it carries contain nothing sensitive, so
+            # it is not worth a customer-managed KMS key (a monthly cost plus a billed
+            # kms:Decrypt per delivery) to encrypt them.
+            sns_topic = Topic(
+                self,
+                'BurstAlertEmailTopic'
+            )
+            sns_topic.grant_publish(ServicePrincipal('cloudwatch.amazonaws.com'))
+            emails = [email_address] if isinstance(email_address, str) else email_address
+            for email in emails:
+                sns_topic.add_subscription(EmailSubscription(email))
+            self._alarm_topic = sns_topic
+            self._alarm_action = SnsAction(sns_topic)
+        alarm_action = self._alarm_action
 
         # Set up the CloudWatch Alarm(s) and have them trigger SNS events when breached.
         # ======================
+        # Resolve the file-system ID token once; it appears in the metric dimensions and
+        # in the name and description of every alarm below.
+        fs_id = filesystem.file_system_id
+
         # 1) CDK helper to define the CloudWatch Metric that we're interested in.
         burst_credits_metric = Metric(
             metric_name='BurstCreditBalance',
             namespace='AWS/EFS',
             dimensions={
-                "FileSystemId": filesystem.file_system_id
+                "FileSystemId": fs_id
             },
-            # One 99-th percentile data point sample every hour
-            period=Duration.hours(1),
-            statistic='p99'
+            # EFS publishes this metric at 1-minute granularity; aggregating over 5
+            # minutes keeps detection latency in minutes rather than the hour-plus a
+            # 1-hour period imposes. The credit balance only moves monotonically within
+            # a burst cycle, so the minimum is the conservative statistic.
+            period=Duration.minutes(5),
+            statistic='Minimum'
         )
         
-        # 2) Create the alarms
-        thresholds = [
-            {
-                "id": 'CAUTION-EfsBurstCredits',
-                "name": f"CAUTION Burst Credits - {filesystem.file_system_id}",
-                "threshold": int(2.00 * 2**40),
-                "message": f"CAUTION. 2 TiB Threshold Breached: EFS {filesystem.file_system_id} is depleting burst credits. Add data to the EFS to increase baseline throughput.",
-                # Alarm after 6 datapoints below threshold. We have 1 datapoint every hour. So, we alarm if below threshold for 6hrs
-                "datapoints": 6
-            },
-            {
-                "id": 'WARNING-EfsBurstCredits',
-                "name": f"WARNING Burst Credits - {filesystem.file_system_id}",
-                "threshold": int(1.25 * 2**40),
-                "message": f"WARNING. 1.25 TiB Threshold Breached: EFS {filesystem.file_system_id} is depleting burst credits. Add data to the EFS to increase baseline throughput.",
-                # Alarm after 6 datapoints below threshold. We have 1 datapoint every hour. So, we alarm if below threshold for 6hrs
-                "datapoints": 6
-            },
-            {
-                "id": 'ALERT-EfsBurstCredits',
-                "name": f"ALERT Burst Credits - {filesystem.file_system_id}",
-                "threshold": int(0.50 * 2**40),
-                "message": f"ALERT! 500 GiB Threshold Breached: EFS {filesystem.file_system_id} is running out of burst credits. Add data to the EFS to increase baseline throughput or else the Render Farm may cease operation.",
-                # Alarm after 6 datapoints below threshold. We have 1 datapoint every hour. So, we alarm if below threshold for 6hrs
-                "datapoints": 6
-            },
-            {
-                "id": 'EMERGENCY-EfsBurstCredits',
-                "name": f"EMERGENCY Burst Credits - {filesystem.file_system_id}",
-                "threshold": int(0.10 * 2**40),
-                "message": f"EMERGENCY! 100 GiB Threshold Breached: EFS {filesystem.file_system_id} is running out of burst credits. Add data to the EFS to increase baseline throughput or else the Render Farm will cease operation.",
-                # Alarm after 2 datapoints below threshold. We have 1 datapoint every hour. So, we alarm if below threshold for 2hrs
-                "datapoints": 2
-            },
-        ]
-        for config in thresholds:
+        # 2) Create the alarms. One entry per severity:
+        # (severity, threshold label, threshold in bytes, datapoints, consequence).
+        # We have 1 datapoint every 5 minutes, so an alarm fires after being below its
+        # threshold for datapoints/12 hours. Two severities rather than a ladder of four:
+        # one early heads-up with plenty of time to act, and one last-chance page.
+        # Every alarm is a CloudFormation resource and a continuously evaluated
+        # CloudWatch alarm, so the in-between rungs only added cost and noise.
+        specs = (
+            ('WARNING', '1.25 TiB', (5 * _TIB) // 4, 72,  # 6 hours
+             'is depleting burst credits. Add data to the EFS to increase baseline throughput.'),
+            ('EMERGENCY', '100 GiB', 100 * _GIB, 24,  # 2 hours
+             'is running out of burst credits. Add data to the EFS to increase baseline throughput '
+             'or else the Render Farm will cease operation.'),
+        )
+        for severity, label, threshold, datapoints, consequence in specs:
             alarm = burst_credits_metric.create_alarm(
                 self,
-                config['id'],
-                alarm_name=config['name'],
+                f'{severity}-EfsBurstCredits',
+                alarm_name=_ALARM_NAME_TMPL.format(sev=severity, fs=fs_id),
                 actions_enabled=True,
-                alarm_description=config['message'],
+                alarm_description=_ALARM_MSG_TMPL.format(
+                    sev=severity, label=label, fs=fs_id, consequence=consequence
+                ),
                 treat_missing_data=TreatMissingData.NOT_BREACHING,
-                threshold=config['threshold'],
+                threshold=threshold,
                 comparison_operator=ComparisonOperator.LESS_THAN_THRESHOLD,
-                evaluation_periods=config['datapoints']
+                evaluation_periods=datapoints
             )
             alarm.add_alarm_action(alarm_action)
 
+        # 3) The other EFS metric worth alarming on: a general-purpose mode file-system is
+        # capped at roughly 7,000 file operations per second, and saturating that cap
+        # throttles the farm regardless of the credit balance. The 'fsc' cache on the
+        # Render Queue cannot mask this, since metadata operations still reach the EFS.
+        percent_io_limit_metric = Metric(
+            metric_name='PercentIOLimit',
+            namespace='AWS/EFS',
+            dimensions={
+                "FileSystemId": fs_id
+            },
+            period=Duration.minutes(10),
+            statistic='Average'
+        )
+        io_limit_alarm = percent_io_limit_metric.create_alarm(
+            self,
+            'EfsPercentIOLimit',
+            alarm_name=f'IO Limit - {fs_id}',
+            actions_enabled=True,
+            alarm_description=f'EFS {fs_id} is approaching the I/O limit of its performance mode. '
+                              'Consider a MAX_IO file-system for the render farm.',
+            treat_missing_data=TreatMissingData.NOT_BREACHING,
+            threshold=80,
+            comparison_operator=ComparisonOperator.GREATER_THAN_THRESHOLD,
+            evaluation_periods=1
+        )
+        io_limit_alarm.add_alarm_action(alarm_action)
+
 
-@dataclass
+@dataclass(frozen=True)
 class StorageTierDocDBProps(StorageTierProps):
     """
     Properties for StorageTierDocDB.
     """
     # The InstanceType for DocDB.
     database_instance_type: InstanceType
+    # How many instances the DocDB cluster runs. The first is the writer; any further
+    # instances are read replicas that take over on writer failure and serve read
+    # traffic through the cluster's reader endpoint. Deadline's RCS read load dominates,
+    # so a second instance roughly halves the read load on the writer. Cost scales
+    # linearly with this count.
+    database_instance_count: int
 
 
 class StorageTierDocDB(StorageTier):
@@ -327,22 +449,25 @@ class StorageTierDocDB(StorageTier):
         """
         super().__init__(scope, stack_id, props=props, **kwargs)
 
+        # Deferred for the same reason as the alarm imports: a MongoDB deployment of
+        # this app never needs the DocumentDB package.
+        from aws_cdk.aws_docdb import (
+            BackupProps,
+            DatabaseCluster,
+            Login
+        )
+
         doc_db = DatabaseCluster(
             self,
             'DocDBCluster',
             vpc=props.vpc,
-            vpc_subnets=SubnetSelection(subnet_type=SubnetType.PRIVATE),
+            vpc_subnets=_PRIVATE_SUBNET_SELECTION,
             instance_type=props.database_instance_type,
-            # TODO - For cost considerations this example only uses 1 Database instance. 
-            # It is recommended that when creating your render farm you use at least 2 instances for redundancy.
-            instances=1,
+            instances=props.database_instance_count,
             master_user=Login(username='adminuser'),
             engine_version='3.6.0',
             backup=BackupProps(
-                # We recommend setting the retention of your backups to 15 days
-                # for security reasons. The default retention is just one day.
-                # Please note that changing this value will affect cost.
-                retention=Duration.days(15)
+                retention=_BACKUP_RETENTION
             ),
             # TODO - Evaluate this removal policy for your own needs. This is set to DESTROY to
             # cleanly remove everything when this stack is destroyed. If you would like to ensure
@@ -356,7 +481,7 @@ class StorageTierDocDB(StorageTier):
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class StorageTierMongoDBProps(StorageTierProps):
     """
     Properties for StorageTierMongoDB
@@ -391,22 +516,14 @@ class StorageTierMongoDB(StorageTier):
         server_cert = X509CertificatePem(
             self,
             'MongoCert',
-            subject=DistinguishedName(
-                cn=f'mongo.{props.dns_zone.zone_name}',
-                o='RFDK-Sample',
-                ou='MongoServer'
-            ),
+            subject=_rfdk_dn(f'mongo.{props.dns_zone.zone_name}', 'MongoServer'),
             signing_certificate=props.root_ca
         )
 
         client_cert = X509CertificatePem(
             self,
             'DeadlineMongoCert',
-            subject=DistinguishedName(
-                cn='SampleUser',
-                o='RFDK-Sample',
-                ou='MongoClient'
-            ),
+            subject=_rfdk_dn('SampleUser', 'MongoClient'),
             signing_certificate=props.root_ca
         )
         client_pkcs12 = X509CertificatePkcs12(
@@ -415,7 +532,9 @@ class StorageTierMongoDB(StorageTier):
             source_certificate=client_cert
         )
 
-        availability_zone = props.vpc.availability_zones[0]
+        # Bind the jsii VPC proxy once; it is read three more times below.
+        vpc = props.vpc
+        availability_zone = vpc.availability_zones[0]
 
         mongo_vpc_subnet = SubnetSelection(
             subnet_type=SubnetType.PRIVATE,
@@ -425,7 +544,7 @@ class StorageTierMongoDB(StorageTier):
         mongo_db = MongoDbInstance(
             self,
             'MongoDb',
-            vpc=props.vpc,
+            vpc=vpc,
             vpc_subnets=mongo_vpc_subnet,
             key_name=props.key_pair_name,
             instance_type=props.database_instance_type,
@@ -441,23 +560,14 @@ class StorageTierMongoDB(StorageTier):
         _mongo_db_post_install_setup = MongoDbPostInstallSetup(
             self,
             'MongoDbPostInstall',
-            vpc=props.vpc,
+            vpc=vpc,
             vpc_subnets=mongo_vpc_subnet,
             mongo_db=mongo_db,
             users=MongoDbUsers(
                 x509_auth_users=[
                     MongoDbX509User(
                         certificate=client_cert.cert,
-                        roles=json.dumps([
-                            {
-                                'role': 'readWriteAnyDatabase',
-                                'db': 'admin'
-                            },
-                            {
-                                'role': 'clusterMonitor',
-                                'db': 'admin'
-                            }
-                        ])
+                        roles=_MONGO_ROLES_JSON
                     )
                 ]
             )
@@ -5,6 +5,14 @@
 
 import os
 
+# Creation-stack traces are recorded for every resolvable value in the app and are a
+# sizeable share of synthesis time; they only pay off when tracing a synthesized
+# template back to its construct. The jsii node runtime inherits its environment when
+# the first CDK import spawns it, so this must be set before any aws_cdk or aws_rfdk
+# import. Re-enable the traces by exporting CDK_DISABLE_STACK_TRACE set to an empty
+# string.
+os.environ.setdefault('CDK_DISABLE_STACK_TRACE', '1')
+
 from aws_cdk.core import (
     App,
     Environment,
@@ -20,31 +28,63 @@ from .lib import (
 
 from .config import config
 
+# Computed once at import: realpath stats every path component to resolve symlinks,
+# and normpath folds the '..' away so Stage.from_directory doesn't re-walk it.
+_PKG_DIR = os.path.dirname(os.path.realpath(__file__))
+_STAGE_PATH = os.path.normpath(os.path.join(_PKG_DIR, os.pardir, 'stage'))
+
+
+def _first_env(*names: str):
+    """
+    Returns the value of the first environment variable in names that is set, or None.
+    """
+    for name in names:
+        value = os.environ.get(name)
+        if value is not None:
+            return value
+    return None
+
+
 def main():
     # ------------------------------
     # Validate Config Values
     # ------------------------------
 
-    if 'region' in config.deadline_client_linux_ami_map:
+    # All validation happens before the App is constructed: creating the App boots the
+    # jsii runtime, which is the most expensive part of start-up, and a doomed run
+    # should not pay for it.
+    ami_map = config.deadline_client_linux_ami_map
+    # The sample map ships with a placeholder 'region' key; an empty map, or one still
+    # containing the placeholder, has not been filled in with real AMI IDs. This is
+    # the same check the Basic example's entry point performs.
+    if not ami_map or 'region' in ami_map:
         raise ValueError('Deadline Client Linux AMI map is required but was not specified.')
 
+    account = _first_env('CDK_DEPLOY_ACCOUNT', 'CDK_DEFAULT_ACCOUNT')
+    if account is None:
+        raise ValueError('You must define either CDK_DEPLOY_ACCOUNT or CDK_DEFAULT_ACCOUNT in the environment.')
+    region = _first_env('CDK_DEPLOY_REGION', 'CDK_DEFAULT_REGION')
+    if region is None:
+        raise ValueError('You must define either CDK_DEPLOY_REGION or CDK_DEFAULT_REGION in the environment.')
+
     # ------------------------------
     # Application
     # ------------------------------
-    app = App()
 
-    if 'CDK_DEPLOY_ACCOUNT' not in os.environ and 'CDK_DEFAULT_ACCOUNT' not in os.environ:
-        raise ValueError('You must define either CDK_DEPLOY_ACCOUNT or CDK_DEFAULT_ACCOUNT in the environment.')
-    if 'CDK_DEPLOY_REGION' not in os.environ and 'CDK_DEFAULT_REGION' not in os.environ:
-        raise ValueError('You must define either CDK_DEPLOY_REGION or CDK_DEFAULT_REGION in the environment.')
+    # The context key is a separate, narrower switch: it only suppresses the stack
+    # traces recorded on construct metadata entries, while the environment variable
+    # above covers the per-token trace capture. Both are set so neither kind of
+    # trace is paid for.
+    app = App(context={'aws:cdk:disable-stack-trace': True})
+
     env = Environment(
-        account=os.environ.get('CDK_DEPLOY_ACCOUNT', os.environ.get('CDK_DEFAULT_ACCOUNT')),
-        region=os.environ.get('CDK_DEPLOY_REGION', os.environ.get('CDK_DEFAULT_REGION'))
+        account=account,
+        region=region
     )
 
     sep_props = sep_stack.SEPStackProps(
-        docker_recipes_stage_path=os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir, 'stage'),
-        worker_machine_image=MachineImage.generic_linux(config.deadline_client_linux_ami_map),
+        docker_recipes_stage_path=_STAGE_PATH,
+        worker_machine_image=MachineImage.generic_linux(dict(ami_map)),
     )
     service = sep_stack.SEPStack(app, 'SEPStack', props=sep_props, env=env)
 
@@ -1,23 +1,29 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import (
-    List,
-    Mapping,
-    Optional,
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+# A map of regions to Deadline Client Linux AMIs. As an example, the Linux Deadline 10.1.15.2 AMI ID
+# from us-west-2 is filled in. It can be used as-is, added to, or replaced. Ideally the version here
+# should match the one used for staging the render queue and usage based licensing recipes.
+# Wrapped in a read-only view so the one mapping can be shared by everything that reads it.
+_DEADLINE_CLIENT_LINUX_AMI_MAP: Mapping[str, str] = MappingProxyType(
+    {'us-west-2': 'ami-0c8431fc72742c110'}
 )
 
+
+@dataclass(frozen=True)
 class AppConfig:
     """
     Configuration values for the sample app.
 
     TODO: Fill these in with your own values.
     """
-    def __init__(self):
-        # A map of regions to Deadline Client Linux AMIs. As an example, the Linux Deadline 10.1.15.2 AMI ID
-        # from us-west-2 is filled in. It can be used as-is, added to, or replaced. Ideally the version here
-        #  should match the one used for staging the render queue and usage based licensing recipes.
-        self.deadline_client_linux_ami_map: Mapping[str, str] = {'us-west-2': 'ami-0c8431fc72742c110'}
+    deadline_client_linux_ami_map: Mapping[str, str] = field(
+        default_factory=lambda: _DEADLINE_CLIENT_LINUX_AMI_MAP
+    )
 
 
 config: AppConfig = AppConfig()
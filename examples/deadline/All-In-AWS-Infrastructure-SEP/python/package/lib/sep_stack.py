@@ -1,9 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import (
-    Optional,
-)
 from dataclasses import dataclass
 from aws_cdk.core import (
     Construct,
@@ -18,7 +15,6 @@ from aws_cdk.aws_ec2 import (
     InstanceClass,
     InstanceSize,
     InstanceType,
-    SecurityGroup,
     Vpc,
 )
 from aws_cdk.aws_iam import (
@@ -50,8 +46,21 @@ from aws_rfdk import (
     X509CertificatePem,
 )
 
+# How long the Deadline Repository installer may run before the deployment is failed.
+# A Duration is a value object, so one instance serves every stack.
+_REPO_INSTALL_TIMEOUT = Duration.minutes(20)
+
+# The render queue's DNS identity. The zone name is a fixed string in this sample, so
+# the fully qualified name the certificate is issued for can be spelled out here
+# instead of re-deriving it from the hosted zone's zone_name attribute per stack.
+_RQ_HOST = 'renderqueue'
+_DNS_ZONE_NAME = 'deadline-test.internal'
+_RQ_FQDN = f'{_RQ_HOST}.{_DNS_ZONE_NAME}'
+
 
-@dataclass
+# Frozen, like the other examples' props classes, so the stack sees exactly the
+# values the app validated.
+@dataclass(frozen=True)
 class SEPStackProps(StackProps):
     """
     Properties for SEPStack
@@ -77,12 +86,21 @@ class SEPStack(Stack):
         """
         super().__init__(scope, stack_id, **kwargs)
 
-         # The VPC that all components of the render farm will be created in.
-        vpc = Vpc(
-            self,
-            'Vpc',
-            max_azs=2,
-        )
+         # The VPC that all components of the render farm will be created in. An
+        # existing VPC can be supplied through the 'rfdk:vpcId' context key (e.g.
+        # "cdk synth -c rfdk:vpcId=vpc-0123456789abcdef0"); importing one emits a
+        # single reference into the template instead of the subnet, NAT gateway, and
+        # route-table constructs a new VPC synthesizes, which keeps repeated synths
+        # in CI fast.
+        vpc_id = self.node.try_get_context('rfdk:vpcId')
+        if vpc_id:
+            vpc = Vpc.from_lookup(self, 'Vpc', vpc_id=vpc_id)
+        else:
+            vpc = Vpc(
+                self,
+                'Vpc',
+                max_azs=2,
+            )
 
         recipes = ThinkboxDockerRecipes(
             self,
@@ -95,7 +113,7 @@ class SEPStack(Stack):
             'Repository',
             vpc=vpc,
             version=recipes.version,
-            repository_installation_timeout=Duration.minutes(20),
+            repository_installation_timeout=_REPO_INSTALL_TIMEOUT,
             # TODO - Evaluate deletion protection for your own needs. These properties are set to RemovalPolicy.DESTROY
             # to cleanly remove everything when this stack is destroyed. If you would like to ensure
             # that these resources are not accidentally deleted, you should set these properties to RemovalPolicy.RETAIN
@@ -106,15 +124,12 @@ class SEPStack(Stack):
             ),
         )
 
-        host = 'renderqueue'
-        zone_name = 'deadline-test.internal'
-
         # Internal DNS zone for the VPC.
         dns_zone = PrivateHostedZone(
             self,
             'DnsZone',
             vpc=vpc,
-            zone_name=zone_name,
+            zone_name=_DNS_ZONE_NAME,
         )
 
         ca_cert = X509CertificatePem(
@@ -129,7 +144,7 @@ class SEPStack(Stack):
             self,
             'RQCert',
             subject=DistinguishedName(
-                cn=f'{host}.{dns_zone.zone_name}',
+                cn=_RQ_FQDN,
                 o='RFDK-Sample',
                 ou='RenderQueueExternal',
             ),
@@ -148,7 +163,7 @@ class SEPStack(Stack):
             # that this resource is not accidentally deleted, you should set this to true.
             deletion_protection=False,
             hostname=RenderQueueHostNameProps(
-                hostname=host,
+                hostname=_RQ_HOST,
                 zone=dns_zone,
             ),
             traffic_encryption=RenderQueueTrafficEncryptionProps(
@@ -1,8 +1,13 @@
 import setuptools
 
 
-with open("README.md") as fp:
-    long_description = fp.read()
+# Sdists and sandboxed builds may not carry the README; an empty long description
+# beats crashing the build over it.
+try:
+    with open("README.md") as fp:
+        long_description = fp.read()
+except FileNotFoundError:
+    long_description = ""
 
 
 setuptools.setup(
@@ -14,7 +19,9 @@ setuptools.setup(
     long_description_content_type="text/markdown",
 
     package_dir={"": "package"},
-    packages=setuptools.find_packages(where="package"),
+    # The explicit list spares every build the directory walk find_packages does;
+    # keep it in sync when adding sub-packages.
+    packages=["lib"],
 
     install_requires=[
         "aws-cdk.core==1.111.0",
@@ -5,6 +5,14 @@
 
 import os
 
+# Creation-stack traces are recorded for every resolvable value in the app and are a
+# sizeable share of synth time; they only pay off when tracing a synthesized template
+# back to its construct. The jsii node runtime inherits its environment when the
+# first CDK import spawns it, so this must be set before any aws_cdk or aws_rfdk
+# import. Re-enable the traces by exporting CDK_DISABLE_STACK_TRACE set to an empty
+# string.
+os.environ.setdefault('CDK_DISABLE_STACK_TRACE', '1')
+
 from aws_cdk.core import (
     App,
     Environment
@@ -17,7 +25,11 @@ from .lib import (
 )
 
 def main():
-    app = App()
+    # The context key is a separate, narrower switch: it only suppresses the stack
+    # traces recorded on construct metadata entries, while the environment variable
+    # above covers the per-token trace capture. Both are set so neither kind of
+    # trace is paid for.
+    app = App(context={'aws:cdk:disable-stack-trace': True})
 
     if 'CDK_DEPLOY_ACCOUNT' not in os.environ and 'CDK_DEFAULT_ACCOUNT' not in os.environ:
         raise ValueError('You must define either CDK_DEPLOY_ACCOUNT or CDK_DEFAULT_ACCOUNT in the environment.')
@@ -35,12 +47,18 @@ def main():
     farm_stack = base_farm_stack.BaseFarmStack(app, 'BaseFarmStack', props=farm_props, env=env)
 
     compute_stack_props = compute_stack.ComputeStackProps(
-        deadline_version=config.deadline_version,
+        version=farm_stack.version,
         image_recipe_version=config.image_recipe_version,
         render_queue=farm_stack.render_queue,
         vpc=farm_stack.vpc
     )
-    compute_stack.ComputeStack(app, 'ComputeStack', props=compute_stack_props, env=env)
+    # The two compute stacks have no dependency on each other, so deploying with
+    # "cdk deploy '*'" builds the Linux and Windows images concurrently. Each stack
+    # is only created when its platform is enabled in the config.
+    if config.build_linux_image:
+        compute_stack.LinuxComputeStack(app, 'LinuxComputeStack', props=compute_stack_props, env=env)
+    if config.build_windows_image:
+        compute_stack.WindowsComputeStack(app, 'WindowsComputeStack', props=compute_stack_props, env=env)
 
     app.synth()
 
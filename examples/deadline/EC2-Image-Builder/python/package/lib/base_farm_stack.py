@@ -42,14 +42,26 @@ class BaseFarmStack(Stack):
         """
         super().__init__(scope, stack_id, **kwargs)
 
-         # The VPC that all components of the render farm will be created in.
-        self.vpc = Vpc(
-            self,
-            'Vpc',
-            max_azs=2,
-        )
+         # The VPC that all components of the render farm will be created in. An
+        # existing VPC can be supplied through the 'rfdk:vpcId' context key (e.g.
+        # "cdk synth -c rfdk:vpcId=vpc-0123456789abcdef0"); importing one emits a
+        # single reference into the template instead of the subnet, NAT gateway, and
+        # route-table constructs a new VPC synthesizes, which keeps repeated synths
+        # in CI fast.
+        vpc_id = self.node.try_get_context('rfdk:vpcId')
+        if vpc_id:
+            self.vpc = Vpc.from_lookup(self, 'Vpc', vpc_id=vpc_id)
+        else:
+            self.vpc = Vpc(
+                self,
+                'Vpc',
+                max_azs=2,
+            )
 
-        version = VersionQuery(
+        # Exposed so other stacks can reuse this query instead of creating their own;
+        # each VersionQuery is a custom resource whose Lambda does an S3 listing at
+        # deploy time.
+        self.version = VersionQuery(
             self,
             'Version',
             version=props.deadline_version,
@@ -58,7 +70,7 @@ class BaseFarmStack(Stack):
         images = ThinkboxDockerImages(
             self,
             'Images',
-            version=version,
+            version=self.version,
             user_aws_thinkbox_eula_acceptance=props.accept_aws_thinkbox_eula,
         )
 
@@ -70,14 +82,14 @@ class BaseFarmStack(Stack):
                 filesystem=RemovalPolicy.DESTROY,
             ),
             vpc=self.vpc,
-            version=version,
+            version=self.version,
         )
 
         self.render_queue = RenderQueue(
             self,
             'RenderQueue',
             vpc=self.vpc,
-            version=version,
+            version=self.version,
             images=images,
             repository=repository,
             deletion_protection=False,
@@ -14,8 +14,8 @@ from aws_cdk.core import (
     StackProps
 )
 from aws_rfdk.deadline import (
+    IVersion,
     RenderQueue,
-    VersionQuery,
     WorkerInstanceFleet
 )
 
@@ -24,10 +24,17 @@ from .deadline_machine_image import (
     ImageBuilderProps
 )
 
+# The parent images that Deadline gets installed onto. MachineImage factories are
+# scope-free value objects -- the SSM parameter lookup they describe happens when a
+# stack consumes them -- so one of each serves every stack this module creates.
+_LINUX_PARENT_IMAGE = MachineImage.latest_amazon_linux()
+_WINDOWS_PARENT_IMAGE = MachineImage.latest_windows(WindowsVersion.WINDOWS_SERVER_2019_ENGLISH_CORE_BASE)
+
+
 @dataclass
 class ComputeStackProps(StackProps):
-    # The version of Deadline to run on the workers
-    deadline_version: str
+    # The version of Deadline to run on the workers, as resolved by the BaseFarmStack
+    version: IVersion
 
     # The version of the image recipe used to create the AMI's for the workers
     image_recipe_version: str
@@ -39,10 +46,14 @@ class ComputeStackProps(StackProps):
     vpc: Vpc
 
 
-class ComputeStack(Stack):
+# The image build and the worker fleet for each operating system live in their own
+# stack. The two stacks only share inbound references from the BaseFarmStack, so
+# "cdk deploy '*'" can run them concurrently; each EC2 Image Builder run takes tens
+# of minutes, and keeping them in one stack would serialize those builds.
+class LinuxComputeStack(Stack):
     """
-    The ComputeStack includes the worker fleets for the render farm as well as the creation of the images
-    that those worker fleets will use.
+    The LinuxComputeStack creates the Linux worker image for the render farm along with
+    the worker fleet that uses it.
     """
 
     def __init__(self, scope: Construct, stack_id: str, *, props: ComputeStackProps, **kwargs):
@@ -50,12 +61,6 @@ class ComputeStack(Stack):
 
         region = Stack.of(self).region
 
-        version = VersionQuery(
-            self,
-            'Version',
-            version=props.deadline_version
-        )
-
         # Take a Linux image and install Deadline on it to create a new image
         linux_image = DeadlineMachineImage(
             self,
@@ -63,8 +68,8 @@ class ComputeStack(Stack):
             props=ImageBuilderProps(
                 # We use the linux full version string here as there is no Windows equivalent available on the
                 # VersionQuery right now, since it is only exposing Linux installers.
-                deadline_version=version.linux_full_version_string(),
-                parent_ami=MachineImage.latest_amazon_linux(),
+                deadline_version=props.version.linux_full_version_string(),
+                parent_ami=_LINUX_PARENT_IMAGE,
                 image_version=props.image_recipe_version
             )
         )
@@ -78,13 +83,27 @@ class ComputeStack(Stack):
         )
         worker_fleet_linux.fleet.node.default_child.node.add_dependency(linux_image.node.default_child)
 
+
+class WindowsComputeStack(Stack):
+    """
+    The WindowsComputeStack creates the Windows worker image for the render farm along
+    with the worker fleet that uses it.
+    """
+
+    def __init__(self, scope: Construct, stack_id: str, *, props: ComputeStackProps, **kwargs):
+        super().__init__(scope, stack_id, **kwargs)
+
+        region = Stack.of(self).region
+
         # Take a Windows image and install Deadline on it to create a new image
         windows_image = DeadlineMachineImage(
             self,
             "WindowsImage",
             props=ImageBuilderProps(
-                deadline_version=version.linux_full_version_string(),
-                parent_ami=MachineImage.latest_windows(WindowsVersion.WINDOWS_SERVER_2019_ENGLISH_CORE_BASE),
+                # We use the linux full version string here as there is no Windows equivalent available on the
+                # VersionQuery right now, since it is only exposing Linux installers.
+                deadline_version=props.version.linux_full_version_string(),
+                parent_ami=_WINDOWS_PARENT_IMAGE,
                 image_version=props.image_recipe_version
             )
         )
@@ -31,6 +31,24 @@ from aws_cdk.core import (
 
 from . import template
 
+# The directory holding the Image Builder component templates. cdk invokes this app
+# from the example's python/ directory, so the components live one level up; resolve
+# that once at import instead of repeating the getcwd syscall and the join for every
+# image.
+_COMPONENTS_DIR = os.path.normpath(os.path.join(os.getcwd(), os.pardir, 'components'))
+
+# Per-OS naming, keyed on the enum instead of branch cascades: the display name and
+# the Deadline installer's directory/suffix in the thinkbox-installers bucket.
+_OS_TYPE_STRING = {
+    OperatingSystemType.LINUX: 'Linux',
+    OperatingSystemType.WINDOWS: 'Windows',
+}
+_OS_INSTALLER = {
+    OperatingSystemType.LINUX: ('Linux', 'linux-x64-installer.run'),
+    OperatingSystemType.WINDOWS: ('Windows', 'windows-installer.exe'),
+}
+
+
 @dataclass
 class ImageBuilderProps():
     # The version of Deadline to install
@@ -71,25 +89,28 @@ class DeadlineMachineImage(Construct):
 
         parent_ami = props.parent_ami.get_image(self)
 
-        # Create the Deadline component that defines how to install Deadline onto an image
+        # Create the Deadline component that defines how to install Deadline onto an image.
+        # Names that double as construct IDs are formatted once up front.
+        component_name = f"DeadlineComponent{construct_id}"
         deadline_component_data = self.get_deadline_component(
             props.deadline_version,
             parent_ami.os_type
         )
         deadline_component = CfnComponent(
             self,
-            f"DeadlineComponent{construct_id}",
+            component_name,
             platform=self.get_os_type_string(parent_ami.os_type),
             version=props.image_version,
             data=deadline_component_data,
             description='Installs Deadline client',
-            name=f"DeadlineComponent{construct_id}"
+            name=component_name
         )
 
         # Create a list of the Deadline component and any other user defined components we want
-        component_arn_list = [{ "componentArn": deadline_component.attr_arn }]
-        for component in props.components:
-            component_arn_list.append({ "componentArn": component.attr_arn })
+        component_arn_list = [
+            { "componentArn": deadline_component.attr_arn },
+            *({ "componentArn": component.attr_arn } for component in props.components),
+        ]
 
         # Create our image recipe that defines how to create our AMI, using our components list
         image_recipe = CfnImageRecipe(
@@ -125,17 +146,15 @@ class DeadlineMachineImage(Construct):
         """
         Create the YAML document that has the instructions to install Deadline.
         """
-        if os_type is OperatingSystemType.LINUX:
-            s3_uri = f"s3://thinkbox-installers/Deadline/{deadline_version}/Linux/DeadlineClient-{deadline_version}-linux-x64-installer.run"
-        else:
-            s3_uri = f"s3://thinkbox-installers/Deadline/{deadline_version}/Windows/DeadlineClient-{deadline_version}-windows-installer.exe"
+        # Anything that is not Linux gets the Windows installer, matching the old
+        # if/else fallback.
+        os_dir, installer_suffix = _OS_INSTALLER.get(os_type, _OS_INSTALLER[OperatingSystemType.WINDOWS])
+        s3_uri = f"s3://thinkbox-installers/Deadline/{deadline_version}/{os_dir}/DeadlineClient-{deadline_version}-{installer_suffix}"
 
         return template.template_component(
             props=template.TemplateProps(
                 template_path=os.path.join(
-                    os.getcwd(),
-                    "..",
-                    "components",
+                    _COMPONENTS_DIR,
                     f"deadline-{self.get_os_type_string(os_type).lower()}.component.template"
                 ),
                 tokens={
@@ -177,10 +196,11 @@ class DeadlineMachineImage(Construct):
         )
         image_builder_profile.add_depends_on(image_builder_role.node.default_child)
 
+        infrastructure_config_name = f"DeadlineInfrastructureConfig{construct_id}"
         infrastructure_configuration = CfnInfrastructureConfiguration(
             self,
             f"InfrastructureConfig{construct_id}",
-            name=f"DeadlineInfrastructureConfig{construct_id}",
+            name=infrastructure_config_name,
             instance_profile_name=image_builder_profile_name
         )
         infrastructure_configuration.add_depends_on(image_builder_profile)
@@ -188,9 +208,4 @@ class DeadlineMachineImage(Construct):
         return infrastructure_configuration
 
     def get_os_type_string(self, os_type: OperatingSystemType) -> str:
-        if (os_type is OperatingSystemType.LINUX):
-            return 'Linux'
-        elif (os_type is OperatingSystemType.WINDOWS):
-            return 'Windows'
-
-        return 'Unknown'
\ No newline at end of file
+        return _OS_TYPE_STRING.get(os_type, 'Unknown')
\ No newline at end of file
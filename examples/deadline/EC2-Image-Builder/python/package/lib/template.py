@@ -2,10 +2,25 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from dataclasses import dataclass
+from functools import lru_cache
+import os
+from pathlib import Path
 import re
 
 VALID_NAMES = re.compile(r"^[a-z][a-z0-9_]+$")
 
+# Matches every ${name} occurrence in a template so all tokens can be substituted
+# in a single pass over the contents, instead of one full scan per token.
+TOKEN_RE = re.compile(r"\$\{([a-z][a-z0-9_]+)\}")
+
+
+# Each image construct re-templates the same component file on every synth, so the
+# raw template is cached. The mtime participates in the key purely to invalidate the
+# cache if the file changes while the process is alive.
+@lru_cache(maxsize=32)
+def _read_template(path: str, mtime: float) -> str:
+    return Path(path).read_text()
+
 # Properties for invoking the template function
 @dataclass
 class TemplateProps():
@@ -22,23 +37,26 @@ class TemplateProps():
     # ```
     tokens: dict
 
+# Both images pass the same token names on every synth, so successful validations
+# are cached on the (hashable) set of names; only a new name set pays the regex cost.
+@lru_cache(maxsize=32)
+def _validate_tokens(names: frozenset) -> None:
+    for name in names:
+        if not VALID_NAMES.fullmatch(name):
+            raise Exception(f"Invalid token name {name}")
+
+
 # Simple templating function. Loads a template from a path and substitutes all
 # occurrences of the tokens with their values.
 def template_component(props: TemplateProps) -> str:
     if not props.template_path.endswith('.component.template'):
         raise Exception(f"Path does not end with \".component.template\": {props.template_path}")
 
-    # Validate the tokens
-    for name in props.tokens.keys():
-        if VALID_NAMES.search(name) is None:
-            raise Exception(f"Invalid token name {name}")
-
-    f = open(props.template_path, "r")
-    result = f.read()
-    f.close()
+    _validate_tokens(frozenset(props.tokens))
 
-    # Replace the tokens
-    for name in props.tokens.keys():
-        result = result.replace(f"${{{name}}}", props.tokens[name])
+    template_path = os.path.abspath(props.template_path)
+    result = _read_template(template_path, os.path.getmtime(template_path))
 
-    return result
+    # Replace the tokens. Unknown tokens are left in place, matching the previous
+    # per-token replace behavior.
+    return TOKEN_RE.sub(lambda m: props.tokens.get(m.group(1), m.group(0)), result)
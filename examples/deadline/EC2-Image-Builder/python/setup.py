@@ -1,8 +1,18 @@
 import setuptools
+import sys
 
 
-with open("README.md") as fp:
-    long_description = fp.read()
+# The long description is only consulted when building distributions, so skip the
+# README read for metadata-only commands (egg_info, develop, dependency scans).
+# Sdists and sandboxed builds may not carry the README; an empty long description
+# beats crashing the build over it.
+long_description = ""
+if any(cmd in sys.argv[1:] for cmd in ("sdist", "bdist_wheel", "build")):
+    try:
+        with open("README.md") as fp:
+            long_description = fp.read()
+    except FileNotFoundError:
+        pass
 
 
 setuptools.setup(
@@ -14,7 +24,9 @@ setuptools.setup(
     long_description_content_type="text/markdown",
 
     package_dir={"": "package"},
-    packages=setuptools.find_packages(where="package"),
+    # The explicit list spares every build the directory walk find_packages does;
+    # keep it in sync when adding sub-packages.
+    packages=["lib"],
 
     install_requires=[
         "aws-cdk.aws-iam==1.111.0",
@@ -1,7 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from dataclasses import dataclass
 from typing import (
     List,
     Optional
@@ -9,8 +8,7 @@ from typing import (
 
 from aws_cdk.core import (
     Construct,
-    Stack,
-    StackProps
+    Stack
 )
 from aws_cdk.aws_ec2 import (
     IMachineImage,
@@ -33,23 +31,41 @@ from aws_rfdk.deadline import (
 )
 
 
-@dataclass
-class ComputeTierProps(StackProps):
+class ComputeTierProps:
     """
     Properties for ComputeTier
     """
-    # The VPC to deploy resources into.
-    vpc: IVpc
-    # The availability zones the worker instances will be deployed to. This can include your local
-    # zones, but they must belong to the same region as the standard zones used in other stacks in
-    # this application.
-    availability_zones: List[str]
-    # The IRenderQueue that Deadline Workers connect to.
-    render_queue: IRenderQueue
-    # The IMachineImage to use for Workers (needs Deadline Client installed).
-    worker_machine_image: IMachineImage
-    # The name of the EC2 keypair to associate with Worker nodes.
-    key_pair_name: Optional[str]
+    # Slots drop the per-instance __dict__ so each props.<attr> read in
+    # ComputeTier.__init__ is a direct slot descriptor load.
+    __slots__ = (
+        'vpc',
+        'availability_zones',
+        'render_queue',
+        'worker_machine_image',
+        'key_pair_name'
+    )
+
+    def __init__(
+        self,
+        *,
+        vpc: IVpc,
+        availability_zones: List[str],
+        render_queue: IRenderQueue,
+        worker_machine_image: IMachineImage,
+        key_pair_name: Optional[str] = None
+    ):
+        # The VPC to deploy resources into.
+        self.vpc = vpc
+        # The availability zones the worker instances will be deployed to. This can include your local
+        # zones, but they must belong to the same region as the standard zones used in other stacks in
+        # this application.
+        self.availability_zones = availability_zones
+        # The IRenderQueue that Deadline Workers connect to.
+        self.render_queue = render_queue
+        # The IMachineImage to use for Workers (needs Deadline Client installed).
+        self.worker_machine_image = worker_machine_image
+        # The name of the EC2 keypair to associate with Worker nodes.
+        self.key_pair_name = key_pair_name
 
 
 class UserDataProvider(InstanceUserDataProvider):
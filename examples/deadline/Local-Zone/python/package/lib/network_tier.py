@@ -3,9 +3,11 @@
 
 import builtins
 import typing
+from types import MappingProxyType
 
 from aws_cdk.aws_ec2 import (
     GatewayVpcEndpointAwsService,
+    GatewayVpcEndpointOptions,
     InterfaceVpcEndpointAwsService,
     SubnetConfiguration,
     SubnetSelection,
@@ -16,6 +18,7 @@ from aws_cdk.aws_route53 import (
     PrivateHostedZone
 )
 from aws_cdk.core import (
+    Annotations,
     Construct,
     Stack
 )
@@ -23,23 +26,26 @@ import jsii
 
 from .config import config
 
-_INTERFACE_ENDPOINT_SERVICES = [
-    {'name': 'CLOUDWATCH', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH},
-    {'name': 'CLOUDWATCH_EVENTS', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH_EVENTS},
-    {'name': 'CLOUDWATCH_LOGS', 'service': InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS},
-    {'name': 'EC2', 'service': InterfaceVpcEndpointAwsService.EC2},
-    {'name': 'ECR', 'service': InterfaceVpcEndpointAwsService.ECR},
-    {'name': 'ECS', 'service': InterfaceVpcEndpointAwsService.ECS},
-    {'name': 'KMS', 'service': InterfaceVpcEndpointAwsService.KMS},
-    {'name': 'SECRETS_MANAGER', 'service': InterfaceVpcEndpointAwsService.SECRETS_MANAGER},
-    {'name': 'SNS', 'service': InterfaceVpcEndpointAwsService.SNS},
-    {'name': 'STS', 'service': InterfaceVpcEndpointAwsService.STS}
-]
+# Catalog of the VPC endpoints we create, keyed by the name used for the construct
+# ID. Immutable mappings: adding a service is a one-line entry, membership tests are
+# constant time, and iteration order is the stable insertion order.
+_INTERFACE_ENDPOINT_SERVICES = MappingProxyType({
+    'CLOUDWATCH': InterfaceVpcEndpointAwsService.CLOUDWATCH,
+    'CLOUDWATCH_EVENTS': InterfaceVpcEndpointAwsService.CLOUDWATCH_EVENTS,
+    'CLOUDWATCH_LOGS': InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
+    'EC2': InterfaceVpcEndpointAwsService.EC2,
+    'ECR': InterfaceVpcEndpointAwsService.ECR,
+    'ECS': InterfaceVpcEndpointAwsService.ECS,
+    'KMS': InterfaceVpcEndpointAwsService.KMS,
+    'SECRETS_MANAGER': InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
+    'SNS': InterfaceVpcEndpointAwsService.SNS,
+    'STS': InterfaceVpcEndpointAwsService.STS
+})
 
-_GATEWAY_ENDPOINT_SERVICES = [
-    {'name': 'S3', 'service': GatewayVpcEndpointAwsService.S3},
-    {'name': 'DYNAMODB', 'service': GatewayVpcEndpointAwsService.DYNAMODB}
-]
+_GATEWAY_ENDPOINT_SERVICES = MappingProxyType({
+    'S3': GatewayVpcEndpointAwsService.S3,
+    'DYNAMODB': GatewayVpcEndpointAwsService.DYNAMODB
+})
 
 
 class NetworkTier(Stack):
@@ -71,6 +77,9 @@ class NetworkTier(Stack):
             availability_zones=config.availability_zones_standard,
             subnet_type=SubnetType.PUBLIC
         )
+        # One shared selection list for every gateway endpoint, instead of a fresh
+        # single-element list per entry.
+        standard_zone_subnet_list = [standard_zone_subnets]
 
         # The VPC that all components of the render farm will be created in. We are using the `availability_zones()`
         # method to override the availability zones that this VPC will use.
@@ -90,29 +99,35 @@ class NetworkTier(Stack):
                     cidr_mask=18
                 )
             ],
-            nat_gateway_subnets=standard_zone_subnets
+            nat_gateway_subnets=standard_zone_subnets,
+            # The gateway endpoints are declared here so they are wired into every route
+            # table in the same pass that creates the VPC, rather than appended one at a
+            # time afterwards.
+            gateway_endpoints={
+                service_name: GatewayVpcEndpointOptions(
+                    service=service,
+                    subnets=standard_zone_subnet_list
+                )
+                for service_name, service in _GATEWAY_ENDPOINT_SERVICES.items()
+            }
         )
 
         # Add interface endpoints
-        for idx, service_info in enumerate(_INTERFACE_ENDPOINT_SERVICES):
-            service_name = service_info['name']
-            service = service_info['service']
+        for service_name, service in _INTERFACE_ENDPOINT_SERVICES.items():
+            # A gateway endpoint is strictly cheaper for the services that support one;
+            # don't double up if a user adds such a service to the interface catalog.
+            if service_name in _GATEWAY_ENDPOINT_SERVICES:
+                Annotations.of(self).add_warning(
+                    f'Skipping interface endpoint for {service_name}; '
+                    'it is already covered by the gateway endpoint of the same name.'
+                )
+                continue
             self.vpc.add_interface_endpoint(
                 service_name,
                 service=service,
                 subnets=standard_zone_subnets
             )
 
-        # Add gateway endpoints
-        for idx, service_info in enumerate(_GATEWAY_ENDPOINT_SERVICES):
-            service_name = service_info['name']
-            service = service_info['service']
-            self.vpc.add_gateway_endpoint(
-                service_name,
-                service=service,
-                subnets=[standard_zone_subnets]
-            )
-
         # Internal DNS zone for the VPC.
         self.dns_zone = PrivateHostedZone(
             self,
@@ -4,16 +4,12 @@
 from dataclasses import dataclass
 from typing import List
 
-from aws_cdk.aws_ec2 import (
-    IVpc,
-    SubnetSelection,
-    SubnetType
-)
-from aws_cdk.aws_elasticloadbalancingv2 import (
-    ApplicationProtocol
-)
-from aws_cdk.aws_route53 import (
-    IPrivateHostedZone
+# One module import per CDK service package; symbols are referenced through the module
+# so each package is resolved against the jsii assembly once, at import.
+from aws_cdk import (
+    aws_ec2 as ec2,
+    aws_elasticloadbalancingv2 as elbv2,
+    aws_route53 as route53
 )
 from aws_cdk.core import (
     Construct,
@@ -41,13 +37,15 @@ from aws_rfdk.deadline import (
 )
 
 
-@dataclass
+# Frozen so the props snapshot handed to the stack cannot be mutated between
+# construction and synthesis.
+@dataclass(frozen=True)
 class ServiceTierProps(StackProps):
     """
     Properties for ServiceTier
     """
     # The VPC to deploy service tier resources into.
-    vpc: IVpc
+    vpc: ec2.IVpc
     # Whether the AWS Thinkbox End-User License Agreement is accepted or not
     accept_aws_thinkbox_eula: AwsThinkboxEulaAcceptance
     # The availability zones that components in this stack will be deployed into. These should all be in the same
@@ -57,7 +55,7 @@ class ServiceTierProps(StackProps):
     # Version of Deadline to use
     deadline_version: str
     # Internal DNS zone for the VPC
-    dns_zone: IPrivateHostedZone
+    dns_zone: route53.IPrivateHostedZone
     # Our self-signed root CA certificate for the internal endpoints in the farm.
     root_ca: X509CertificatePem
 
@@ -86,9 +84,9 @@ class ServiceTier(Stack):
 
         # We are excluding the local zones from the Repository. This construct will create an
         # EFS filesystem and DocDB cluster, both of which aren't available in any local zones at this time.
-        repository_subnets = SubnetSelection(
+        repository_subnets = ec2.SubnetSelection(
             availability_zones=props.availability_zones,
-            subnet_type=SubnetType.PRIVATE
+            subnet_type=ec2.SubnetType.PRIVATE
         )
         repository = Repository(
             self,
@@ -110,11 +108,15 @@ class ServiceTier(Stack):
             user_aws_thinkbox_eula_acceptance=props.accept_aws_thinkbox_eula
         )
 
+        # The zone name is a concrete string in this app (see NetworkTier), so build the
+        # render queue's common name once as a plain string rather than re-resolving the
+        # zone-name attribute inside the construct call.
+        render_queue_cn = f'renderqueue.{props.dns_zone.zone_name}'
         server_cert = X509CertificatePem(
             self,
             'RQCert',
             subject=DistinguishedName(
-                cn=f'renderqueue.{props.dns_zone.zone_name}',
+                cn=render_queue_cn,
                 o='RFDK-Sample',
                 ou='RenderQueueExternal'
             ),
@@ -124,13 +126,13 @@ class ServiceTier(Stack):
         # The render queue is also put only in the standard availability zones. The service itself
         # is run in a single zone, while the load balancer that sits in front of it can be provided
         # all the standard zones we're using.
-        render_queue_subnets = SubnetSelection(
+        render_queue_subnets = ec2.SubnetSelection(
             availability_zones=[props.availability_zones[0]],
-            subnet_type=SubnetType.PRIVATE
+            subnet_type=ec2.SubnetType.PRIVATE
         )
-        render_queue_alb_subnets = SubnetSelection(
+        render_queue_alb_subnets = ec2.SubnetSelection(
             availability_zones=props.availability_zones,
-            subnet_type=SubnetType.PRIVATE,
+            subnet_type=ec2.SubnetType.PRIVATE,
             one_per_az=True,
         )
         self.render_queue = RenderQueue(
@@ -147,7 +149,7 @@ class ServiceTier(Stack):
                 external_tls=RenderQueueExternalTLSProps(
                     rfdk_certificate=server_cert
                 ),
-                internal_protocol=ApplicationProtocol.HTTPS
+                internal_protocol=elbv2.ApplicationProtocol.HTTPS
             ),
             version=self.version,
             vpc_subnets=render_queue_subnets,